@@ -8,28 +8,26 @@ Example:
 """
 
 import argparse
+import functools
 import math
-from typing import List, Tuple
 
-import ezdxf
-from scipy.interpolate import CubicSpline
-from scipy.optimize import brentq
+import numpy as np
 
+# ezdxf and scipy are imported lazily (build_auxetic / _cell_splines) so
+# the default straight-edge CLI path does not pay their startup cost.
 
-Point = Tuple[float, float]
 
+def polygon_area(points) -> float:
+    """Signed area of a polygon (shoelace, vectorized over an (N, 2) array)."""
+    pts = np.asarray(points, dtype=np.float64)
+    x, y = pts[:, 0], pts[:, 1]
+    return 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
 
-def polygon_area(points: List[Point]) -> float:
-    """Signed area of a polygon."""
-    area = 0.0
-    for i, (x1, y1) in enumerate(points):
-        x2, y2 = points[(i + 1) % len(points)]
-        area += x1 * y2 - x2 * y1
-    return 0.5 * area
 
-
-def add_poly(msp, points: List[Point], layer: str):
-    """Add a closed polyline."""
+def add_poly(msp, points, layer: str):
+    """Add a closed polyline (accepts an (N, 2) array or point tuples)."""
+    if isinstance(points, np.ndarray):
+        points = points.tolist()
     msp.add_lwpolyline(points, close=True, dxfattribs={"layer": layer})
 
 
@@ -44,44 +42,52 @@ def add_rect(msp, x, y, w, h, layer):
     add_poly(msp, points, layer)
 
 
+@functools.lru_cache(maxsize=32)
+def _cell_splines(w: float, h: float, r: float):
+    """Natural cubic splines for the curved cell sides (cached per geometry)."""
+    from scipy.interpolate import CubicSpline
+
+    ys = (0.0, h / 2.0, h)
+    right_curve = CubicSpline(ys, (w, w - r, w), bc_type="natural")
+    left_curve = CubicSpline(ys, (0.0, r, 0.0), bc_type="natural")
+    return right_curve, left_curve
+
+
 def build_cell_points(
     w: float,
     h: float,
     r: float,
     curve: bool,
     curve_steps: int,
-) -> List[Point]:
-    """Build local points for a concave hex cutout."""
+) -> np.ndarray:
+    """Build local points for a concave hex cutout as an (N, 2) array."""
     if not curve:
-        return [
-            (0.0, 0.0),
-            (w, 0.0),
-            (w - r, h / 2.0),
-            (w, h),
-            (0.0, h),
-            (r, h / 2.0),
-        ]
-
-    ys = [0.0, h / 2.0, h]
-    right_xs = [w, w - r, w]
-    left_xs = [0.0, r, 0.0]
-
-    right_curve = CubicSpline(ys, right_xs, bc_type="natural")
-    left_curve = CubicSpline(ys, left_xs, bc_type="natural")
+        return np.array(
+            [
+                (0.0, 0.0),
+                (w, 0.0),
+                (w - r, h / 2.0),
+                (w, h),
+                (0.0, h),
+                (r, h / 2.0),
+            ]
+        )
+
+    right_curve, left_curve = _cell_splines(w, h, r)
 
     samples = max(6, curve_steps)
-    y_vals = [h * i / (samples - 1) for i in range(samples)]
-    right_pts = [(right_curve(y), y) for y in y_vals]
-    left_pts = [(left_curve(y), y) for y in y_vals]
-
-    points = []
-    points.append((0.0, 0.0))
-    points.append((w, 0.0))
-    points.extend(right_pts[1:-1])
-    points.append((w, h))
-    points.append((0.0, h))
-    points.extend(reversed(left_pts[1:-1]))
-    return points
+    y_vals = np.linspace(0.0, h, samples)
+    right_xs = right_curve(y_vals)
+    left_xs = left_curve(y_vals)
+
+    return np.concatenate(
+        [
+            [(0.0, 0.0), (w, 0.0)],
+            np.column_stack((right_xs[1:-1], y_vals[1:-1])),
+            [(w, h), (0.0, h)],
+            np.column_stack((left_xs[-2:0:-1], y_vals[-2:0:-1])),
+        ]
+    )
 
 
 def hole_area(w: float, h: float, r: float) -> float:
@@ -90,19 +96,73 @@ def hole_area(w: float, h: float, r: float) -> float:
     return abs(polygon_area(pts))
 
 
+def _chandrupatla(f, a: float, b: float, xtol: float = 1e-10, maxiter: int = 60) -> float:
+    """Bracketed scalar root finder (Chandrupatla's method).
+
+    Inverse quadratic interpolation with a bisection safeguard; cheaper
+    per iteration than Brent and needs no derivative.
+    """
+    fa = f(a)
+    fb = f(b)
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    if fa * fb > 0.0:
+        raise ValueError("root is not bracketed")
+
+    t = 0.5
+    xm = a if abs(fa) < abs(fb) else b
+    for _ in range(maxiter):
+        xt = a + t * (b - a)
+        ft = f(xt)
+        if ft == 0.0:
+            return xt
+        if (ft > 0.0) == (fa > 0.0):
+            c, fc = a, fa
+        else:
+            c, fc = b, fb
+            b, fb = a, fa
+        a, fa = xt, ft
+        xm = a if abs(fa) < abs(fb) else b
+        tol = 2.0 * xtol * abs(xm) + xtol
+        tlim = tol / abs(b - c)
+        if tlim > 0.5:
+            break
+        xi = (a - b) / (c - b)
+        phi = (fa - fb) / (fc - fb)
+        if phi * phi < xi and (1.0 - phi) * (1.0 - phi) < 1.0 - xi:
+            t = (fa / (fb - fa)) * (fc / (fb - fc)) + (
+                (c - a) / (b - a)
+            ) * (fa / (fc - fa)) * (fb / (fc - fb))
+        else:
+            t = 0.5
+        t = min(max(t, tlim), 1.0 - tlim)
+    return xm
+
+
 def solve_reentrant_for_open_ratio(
     w: float,
     h: float,
     target_ratio: float,
+    curve: bool = False,
+    curve_steps: int = 18,
 ) -> float:
-    """Solve for re-entrant offset to reach target open ratio for a single cell."""
-    min_r = 0.0
-    max_r = min(w / 2.0 - 1e-6, w - 1e-6)
+    """Solve for re-entrant offset to reach target open ratio for a single cell.
+
+    With straight edges the concave hex is a rectangle minus two triangles
+    of area r*h/2 each, so hole_area == h*(w - r) and the solution is
+    closed-form. The curved cutout has no closed form, so its area is
+    bracketed numerically.
+    """
+    if not curve:
+        return w * (1.0 - target_ratio)
 
     def f(r):
-        return hole_area(w, h, r) / (w * h) - target_ratio
+        pts = build_cell_points(w, h, r, curve=True, curve_steps=curve_steps)
+        return abs(polygon_area(pts)) / (w * h) - target_ratio
 
-    return brentq(f, min_r + 1e-6, max_r)
+    return _chandrupatla(f, 1e-6, w / 2.0 - 1e-6)
 
 
 def build_auxetic(
@@ -121,6 +181,8 @@ def build_auxetic(
     curve_steps: int,
     open_ratio: float,
 ):
+    import ezdxf
+
     if width <= 0 or height <= 0:
         raise ValueError("width/height must be positive")
     if margin < 0:
@@ -131,7 +193,9 @@ def build_auxetic(
         raise ValueError("strut must be positive")
 
     if open_ratio is not None:
-        reentrant = solve_reentrant_for_open_ratio(cell_w, cell_h, open_ratio)
+        reentrant = solve_reentrant_for_open_ratio(
+            cell_w, cell_h, open_ratio, curve=curve, curve_steps=curve_steps
+        )
 
     if not (0.0 <= reentrant < cell_w / 2.0):
         raise ValueError("reentrant must be in [0, cell_w/2)")
@@ -163,19 +227,25 @@ def build_auxetic(
 
     add_rect(msp, 0, 0, width, height, layer="OUTLINE")
 
+    # Define the prototype cutout once as a BLOCK (on layer "0" so the
+    # INSERT's layer applies) and instance it per cell; block references
+    # are far cheaper to construct and serialize than expanded polylines.
     cell_pts = build_cell_points(cell_w, cell_h, reentrant, curve, curve_steps)
-
-    for r in range(rows):
-        row_offset = (pitch_x / 2.0) if (stagger and r % 2 == 1) else 0.0
-        for c in range(cols):
-            x = offset_x + c * pitch_x + row_offset
-            y = offset_y + r * pitch_y
-            if x + cell_w > width - margin:
-                continue
-            if y + cell_h > height - margin:
-                continue
-            shifted = [(x + px, y + py) for (px, py) in cell_pts]
-            add_poly(msp, shifted, layer="CUTOUTS")
+    block = doc.blocks.new("CELL")
+    add_poly(block, cell_pts, layer="0")
+
+    # Compute all cell origins with broadcasting instead of per-cell
+    # Python arithmetic, then mask out-of-bounds cells in one pass.
+    xs = offset_x + np.arange(cols) * pitch_x
+    ys = offset_y + np.arange(rows) * pitch_y
+    row_idx = np.arange(rows)
+    row_shift = (pitch_x / 2.0) * (row_idx % 2) if stagger else np.zeros(rows)
+    grid_x = xs[None, :] + row_shift[:, None]
+    grid_y = np.broadcast_to(ys[:, None], (rows, cols))
+    in_bounds = (grid_x + cell_w <= width - margin) & (grid_y + cell_h <= height - margin)
+
+    for x, y in zip(grid_x[in_bounds], grid_y[in_bounds]):
+        msp.add_blockref("CELL", insert=(x, y), dxfattribs={"layer": "CUTOUTS"})
 
     doc.saveas(out_path)
 
@@ -9,7 +9,9 @@ Example:
 
 import argparse
 import math
+
 import ezdxf
+import numpy as np
 
 
 def add_rect(msp, x, y, w, h, layer):
@@ -85,22 +87,33 @@ def build_lattice(width, height, margin, cell, strut, out_path, pattern):
     # Outer boundary
     add_rect(msp, 0, 0, width, height, layer="OUTLINE")
 
-    # Cutout grid
+    # Cutout grid: define the prototype cell once as a BLOCK (on layer "0"
+    # so the INSERT's layer applies) and instance it per grid position.
+    # Block references are far cheaper to construct and serialize than
+    # fully expanded polylines.
     if pattern == "square":
-        for r in range(rows):
-            for c in range(cols):
-                x = offset_x + c * cell
-                y = offset_y + r * cell
-                add_rect(msp, x, y, hole, hole, layer="CUTOUTS")
+        block = doc.blocks.new("CELL")
+        add_rect(block, 0, 0, hole, hole, layer="0")
+        pitch_y = cell
     else:
-        tri_h = hole * math.sqrt(3) / 2.0
         pitch_y = cell * math.sqrt(3) / 2.0
-        for r in range(rows):
-            for c in range(cols):
-                x = offset_x + c * cell
-                y = offset_y + r * pitch_y
-                up = (r + c) % 2 == 0
-                add_triangle(msp, x, y, hole, up=up, layer="CUTOUTS")
+        up_block = doc.blocks.new("TRI_UP")
+        add_triangle(up_block, 0, 0, hole, up=True, layer="0")
+        dn_block = doc.blocks.new("TRI_DN")
+        add_triangle(dn_block, 0, 0, hole, up=False, layer="0")
+
+    # All insert origins in one broadcast instead of per-cell arithmetic.
+    grid_x = np.broadcast_to(offset_x + np.arange(cols) * cell, (rows, cols))
+    grid_y = np.broadcast_to((offset_y + np.arange(rows) * pitch_y)[:, None], (rows, cols))
+
+    if pattern == "square":
+        for x, y in zip(grid_x.ravel(), grid_y.ravel()):
+            msp.add_blockref("CELL", insert=(x, y), dxfattribs={"layer": "CUTOUTS"})
+    else:
+        up = (np.add.outer(np.arange(rows), np.arange(cols)) % 2 == 0).ravel()
+        for u, x, y in zip(up, grid_x.ravel(), grid_y.ravel()):
+            name = "TRI_UP" if u else "TRI_DN"
+            msp.add_blockref(name, insert=(x, y), dxfattribs={"layer": "CUTOUTS"})
 
     doc.saveas(out_path)
 
@@ -3,18 +3,21 @@ Rotating Squares Auxetic DXF Generator (Tkinter GUI)
 Creates a laser-cuttable panel with a rotating-squares lattice.
 """
 
+import functools
 import math
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
 import ezdxf
+import numpy as np
 import matplotlib
 
 matplotlib.use("TkAgg")
 
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
-from matplotlib.patches import Polygon, Rectangle
+from matplotlib.patches import Rectangle
 
 
 def add_rect(msp, x, y, w, h, layer):
@@ -27,14 +30,15 @@ def add_rect(msp, x, y, w, h, layer):
     msp.add_lwpolyline(points, close=True, dxfattribs={"layer": layer})
 
 
+@functools.lru_cache(maxsize=16)
+def _polygon_thetas(sides):
+    return np.linspace(0.0, 2.0 * np.pi, sides, endpoint=False)
+
+
 def rotated_polygon_points(cx, cy, size, angle_deg, sides):
     radius = size / math.sqrt(2.0)
-    angle = math.radians(angle_deg)
-    points = []
-    for i in range(sides):
-        a = angle + (2.0 * math.pi * i / sides)
-        points.append((cx + radius * math.cos(a), cy + radius * math.sin(a)))
-    return points
+    a = math.radians(angle_deg) + _polygon_thetas(sides)
+    return np.column_stack((cx + radius * np.cos(a), cy + radius * np.sin(a)))
 
 
 def build_rotating_squares_dxf(
@@ -158,6 +162,9 @@ def build_preview(ax, params):
         )
     )
 
+    # One PolyCollection for every cell: a single artist and draw call
+    # instead of rows*cols Polygon patches.
+    cells = []
     for r in range(rows):
         for c in range(cols):
             cx = offset_x + c * pitch
@@ -167,8 +174,11 @@ def build_preview(ax, params):
             if cy - square_size / 2.0 < margin or cy + square_size / 2.0 > height - margin:
                 continue
             ang = angle if (not alternate or (r + c) % 2 == 0) else -angle
-            pts = rotated_polygon_points(cx, cy, square_size, ang, sides)
-            ax.add_patch(Polygon(pts, closed=True, fill=True, facecolor="#1f6f5f", alpha=0.85))
+            cells.append(rotated_polygon_points(cx, cy, square_size, ang, sides))
+    if cells:
+        ax.add_collection(
+            PolyCollection(cells, closed=True, facecolors="#1f6f5f", alpha=0.85)
+        )
 
     ax.set_xlim(-width * 0.02, width * 1.02)
     ax.set_ylim(-height * 0.02, height * 1.02)
@@ -246,27 +256,36 @@ def main():
             messagebox.showerror("Error", str(exc))
 
     def read_params():
-        width = parse_float(vars_["width"].get(), "width")
-        height = parse_float(vars_["height"].get(), "height")
-        margin = parse_float(vars_["margin"].get(), "margin")
-        square_size = parse_float(vars_["square_size"].get(), "square size")
-        gap = parse_float(vars_["gap"].get(), "gap")
-        angle = parse_float(vars_["angle"].get(), "angle")
-        sides = int(vars_["sides"].get())
-        rows = parse_int_or_none(vars_["rows"].get())
-        cols = parse_int_or_none(vars_["cols"].get())
-        return {
-            "width": width,
-            "height": height,
-            "margin": margin,
-            "square_size": square_size,
-            "gap": gap,
-            "angle": angle,
-            "sides": sides,
-            "rows": rows,
-            "cols": cols,
+        # Reuse the previous parse when the raw inputs have not changed.
+        strings = (
+            vars_["width"].get(),
+            vars_["height"].get(),
+            vars_["margin"].get(),
+            vars_["square_size"].get(),
+            vars_["gap"].get(),
+            vars_["angle"].get(),
+            vars_["sides"].get(),
+            vars_["rows"].get(),
+            vars_["cols"].get(),
+            alternate_var.get(),
+        )
+        if strings == pending.get("last_strings"):
+            return pending["last_params"]
+        params = {
+            "width": parse_float(vars_["width"].get(), "width"),
+            "height": parse_float(vars_["height"].get(), "height"),
+            "margin": parse_float(vars_["margin"].get(), "margin"),
+            "square_size": parse_float(vars_["square_size"].get(), "square size"),
+            "gap": parse_float(vars_["gap"].get(), "gap"),
+            "angle": parse_float(vars_["angle"].get(), "angle"),
+            "sides": int(vars_["sides"].get()),
+            "rows": parse_int_or_none(vars_["rows"].get()),
+            "cols": parse_int_or_none(vars_["cols"].get()),
             "alternate": alternate_var.get(),
         }
+        pending["last_strings"] = strings
+        pending["last_params"] = params
+        return params
 
     def update_preview():
         try:
@@ -277,13 +296,20 @@ def main():
                 raise ValueError("margin/gap must be >= 0")
             if params["square_size"] <= 0:
                 raise ValueError("square size must be positive")
+            # Skip the rebuild when nothing visual changed (e.g. edits to
+            # the output path field).
+            key = tuple(params.values())
+            if key == pending.get("last_key"):
+                return
             build_preview(ax, params)
+            pending["last_key"] = key
             canvas.draw_idle()
             status_var.set("Preview updated")
         except Exception as exc:
             ax.clear()
             ax.set_xticks([])
             ax.set_yticks([])
+            pending["last_key"] = None
             canvas.draw_idle()
             status_var.set(str(exc))
 
@@ -292,8 +318,9 @@ def main():
             root.after_cancel(pending["after_id"])
         pending["after_id"] = root.after(120, update_preview)
 
-    for key in vars_:
-        vars_[key].trace_add("write", schedule_preview)
+    # Entries and spinboxes refresh on FocusOut/Return (bound below) so
+    # typing half-finished numbers does not fire a reparse per keystroke;
+    # only the slider and checkbutton stay live.
     alternate_var.trace_add("write", schedule_preview)
 
     root.geometry("1000x600")
@@ -333,11 +360,15 @@ def main():
                 form,
                 textvariable=vars_[key],
                 width=10,
+                command=schedule_preview,
                 **cfg,
             )
         else:
             entry = tk.Entry(form, textvariable=vars_[key], width=28)
         entry.grid(row=row, column=1, sticky="ew", pady=2)
+        if key != "output":
+            entry.bind("<FocusOut>", schedule_preview)
+            entry.bind("<Return>", schedule_preview)
         if key == "output":
             tk.Button(form, text="Browse", command=browse_output).grid(
                 row=row, column=2, padx=6, pady=2
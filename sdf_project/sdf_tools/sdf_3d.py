@@ -8,11 +8,15 @@ Example:
 
 import argparse
 import math
-from typing import Tuple
 
 import numpy as np
 from skimage import measure
 
+try:
+    import numba
+except ImportError:  # optional; NumPy fallback in face_normals
+    numba = None
+
 
 def gyroid(x, y, z):
     return (
@@ -22,44 +26,133 @@ def gyroid(x, y, z):
     )
 
 
-def sdf_field(
-    grid: Tuple[np.ndarray, np.ndarray, np.ndarray],
-    scale: float,
-    iso: float,
-):
-    x, y, z = grid
-    return gyroid(x * scale, y * scale, z * scale) - iso
+def sdf_field(lin: np.ndarray, scale: float, iso: float, z0: int = 0, z1: int = None):
+    """Evaluate the gyroid field on the cube grid spanned by ``lin``.
+
+    The gyroid is separable, so sin/cos are computed once on the 1D axis
+    and the 3D field is assembled by broadcasting instead of materializing
+    full meshgrid coordinate arrays. ``z0``/``z1`` restrict evaluation to
+    a z-slab of the grid for tiled processing.
+    """
+    scaled = np.multiply(np.asarray(lin, dtype=np.float32), np.float32(scale))
+    s = np.empty_like(scaled)
+    c = np.empty_like(scaled)
+    np.sin(scaled, out=s)
+    np.cos(scaled, out=c)
+    res = scaled.size
+    if z1 is None:
+        z1 = res
+    nz = z1 - z0
+    field = np.empty((res, res, nz), dtype=np.float32)
+    np.add(
+        s[:, None, None] * c[None, :, None],      # sin(x)cos(y)
+        s[None, :, None] * c[None, None, z0:z1],  # sin(y)cos(z)
+        out=field,
+    )
+    field += s[None, None, z0:z1] * c[:, None, None]  # sin(z)cos(x)
+    field -= np.float32(iso)
+    return field
+
+
+def sdf_field_tiled(lin, scale: float, iso: float):
+    """Evaluate one 2*pi period of the gyroid and tile it across the grid.
+
+    The gyroid is 2*pi-periodic along each axis, so when the grid step
+    divides the period the full field is one canonical block repeated:
+    evaluation drops from res^3 to (res/R)^3 for R periods per edge.
+    Returns None when the grid does not align with the period; the
+    caller then falls back to full evaluation.
+    """
+    step = float(lin[1] - lin[0])
+    period = 2.0 * math.pi / (step * scale)  # period length in samples
+    p = int(round(period))
+    if p < 2 or p >= lin.size or abs(period - p) > 1e-4:
+        return None
+    block = sdf_field(lin[:p], scale, iso)
+    reps = -(-lin.size // p)  # ceil division
+    return np.tile(block, (reps, reps, reps))[: lin.size, : lin.size, : lin.size]
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _face_normals_numba(tri):
+        n = np.zeros((tri.shape[0], 3), dtype=tri.dtype)
+        for i in numba.prange(tri.shape[0]):
+            ax = tri[i, 1, 0] - tri[i, 0, 0]
+            ay = tri[i, 1, 1] - tri[i, 0, 1]
+            az = tri[i, 1, 2] - tri[i, 0, 2]
+            bx = tri[i, 2, 0] - tri[i, 0, 0]
+            by = tri[i, 2, 1] - tri[i, 0, 1]
+            bz = tri[i, 2, 2] - tri[i, 0, 2]
+            nx = ay * bz - az * by
+            ny = az * bx - ax * bz
+            nz = ax * by - ay * bx
+            norm = math.sqrt(nx * nx + ny * ny + nz * nz)
+            if norm > 1e-9:
+                n[i, 0] = nx / norm
+                n[i, 1] = ny / norm
+                n[i, 2] = nz / norm
+        return n
+
+
+def face_normals(verts, faces):
+    """Unit normals for all faces at once (degenerate faces get zero)."""
+    tri = np.ascontiguousarray(verts[faces])
+    if numba is not None:
+        return _face_normals_numba(tri)
+    # Spell out the cross product: np.cross carries noticeable dispatch
+    # overhead for stacked 3-vectors compared to six elementwise ops.
+    e1 = tri[:, 1] - tri[:, 0]
+    e2 = tri[:, 2] - tri[:, 0]
+    n = np.empty_like(e1)
+    n[:, 0] = e1[:, 1] * e2[:, 2] - e1[:, 2] * e2[:, 1]
+    n[:, 1] = e1[:, 2] * e2[:, 0] - e1[:, 0] * e2[:, 2]
+    n[:, 2] = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+    norms = np.sqrt((n * n).sum(axis=1, keepdims=True))
+    n /= np.where(norms > 1e-9, norms, 1.0)
+    n[norms[:, 0] <= 1e-9] = 0.0
+    return n
+
+
+STL_RECORD_DTYPE = np.dtype(
+    [("n", "<3f4"), ("v0", "<3f4"), ("v1", "<3f4"), ("v2", "<3f4"), ("attr", "<u2")]
+)
+
+
+def stl_records(verts, faces):
+    """Pack triangles into the 50-byte binary STL facet records."""
+    rec = np.zeros(len(faces), dtype=STL_RECORD_DTYPE)
+    rec["n"] = face_normals(verts, faces)
+    rec["v0"] = verts[faces[:, 0]]
+    rec["v1"] = verts[faces[:, 1]]
+    rec["v2"] = verts[faces[:, 2]]
+    return rec
 
 
 def marching_cubes_to_stl(verts, faces, out_path):
-    with open(out_path, "w", encoding="ascii") as f:
-        f.write("solid sdf\n")
-        for face in faces:
-            a = verts[face[0]]
-            b = verts[face[1]]
-            c = verts[face[2]]
-            n = np.cross(b - a, c - a)
-            n_norm = np.linalg.norm(n)
-            if n_norm > 1e-9:
-                n = n / n_norm
-            else:
-                n = np.array([0.0, 0.0, 0.0])
-            f.write(
-                "  facet normal {:.6e} {:.6e} {:.6e}\n".format(n[0], n[1], n[2])
-            )
-            f.write("    outer loop\n")
-            f.write(
-                "      vertex {:.6e} {:.6e} {:.6e}\n".format(a[0], a[1], a[2])
-            )
-            f.write(
-                "      vertex {:.6e} {:.6e} {:.6e}\n".format(b[0], b[1], b[2])
-            )
-            f.write(
-                "      vertex {:.6e} {:.6e} {:.6e}\n".format(c[0], c[1], c[2])
-            )
-            f.write("    endloop\n")
-            f.write("  endfacet\n")
-        f.write("endsolid sdf\n")
+    """Write a binary STL (80-byte header, uint32 count, 50-byte facets)."""
+    write_stl_stream(out_path, [(verts, faces)])
+
+
+def write_stl_stream(out_path, meshes):
+    """Write binary STL from an iterable of (verts, faces) chunks.
+
+    The facet count is not known up front, so a placeholder is written
+    and patched once all chunks have been consumed. Returns the count.
+    """
+    count = 0
+    with open(out_path, "wb") as f:
+        f.write(b"\x00" * 80)
+        f.write(np.uint32(0).tobytes())
+        for verts, faces in meshes:
+            if len(faces) == 0:
+                continue
+            f.write(stl_records(verts, faces).tobytes())
+            count += len(faces)
+        f.seek(80)
+        f.write(np.uint32(count).tobytes())
+    return count
 
 
 def main():
@@ -71,6 +164,17 @@ def main():
     parser.add_argument("--res", type=int, default=120, help="Grid resolution per axis")
     parser.add_argument("--scale", type=float, default=0.18, help="Gyroid scale factor")
     parser.add_argument("--iso", type=float, default=0.0, help="Iso level")
+    parser.add_argument(
+        "--slab",
+        type=int,
+        default=0,
+        help="Z-slab thickness for tiled low-memory export (0 = single pass)",
+    )
+    parser.add_argument(
+        "--periodic-tile",
+        action="store_true",
+        help="Evaluate one gyroid period and tile it when the grid aligns",
+    )
     args = parser.parse_args()
 
     size = args.size
@@ -79,11 +183,40 @@ def main():
         raise ValueError("res must be >= 10")
 
     lin = np.linspace(-size / 2.0, size / 2.0, res, dtype=np.float32)
-    x, y, z = np.meshgrid(lin, lin, lin, indexing="ij")
-    field = sdf_field((x, y, z), scale=args.scale, iso=args.iso)
+    spacing = (lin[1] - lin[0],) * 3
+
+    if args.slab <= 0:
+        field = None
+        if args.periodic_tile:
+            field = sdf_field_tiled(lin, scale=args.scale, iso=args.iso)
+        if field is None:
+            field = sdf_field(lin, scale=args.scale, iso=args.iso)
+        verts, faces, _, _ = measure.marching_cubes(
+            field, level=0.0, spacing=spacing, allow_degenerate=False
+        )
+        marching_cubes_to_stl(verts, faces, args.output)
+        return
+
+    # Tiled export: evaluate the field per z-slab (1-voxel overlap so the
+    # cube layers abut without duplicates), run marching cubes per slab,
+    # and stream the faces straight to the writer. Peak memory drops from
+    # O(res^3) to O(res^2 * slab).
+    step = max(2, args.slab)
+
+    def slab_meshes():
+        for z0 in range(0, res - 1, step):
+            z1 = min(res, z0 + step + 1)
+            sub = sdf_field(lin, scale=args.scale, iso=args.iso, z0=z0, z1=z1)
+            if sub.min() > 0.0 or sub.max() < 0.0:
+                continue  # slab does not cross the isosurface
+            verts, faces, _, _ = measure.marching_cubes(
+                sub, level=0.0, spacing=spacing, allow_degenerate=False
+            )
+            verts[:, 2] += z0 * spacing[2]
+            yield verts, faces
 
-    verts, faces, _, _ = measure.marching_cubes(field, level=0.0, spacing=(lin[1] - lin[0],) * 3)
-    marching_cubes_to_stl(verts, faces, args.output)
+    if write_stl_stream(args.output, slab_meshes()) == 0:
+        raise ValueError("iso level is outside the field range")
 
 
 if __name__ == "__main__":
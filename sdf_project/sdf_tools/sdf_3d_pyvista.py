@@ -13,6 +13,7 @@ from typing import Dict
 
 import numpy as np
 import pyvista as pv
+from vtkmodules.vtkFiltersCore import vtkFlyingEdges3D
 
 
 def gyroid(x, y, z):
@@ -23,22 +24,73 @@ def gyroid(x, y, z):
     )
 
 
-def build_field(size, res, scale, iso):
+def build_field(size, res, scale):
+    # The gyroid is separable: sin/cos are computed once on the 1D axis
+    # and the 3D field assembled by broadcasting, so no res^3 meshgrid
+    # coordinate arrays are materialized and trig work is O(res).
     lin = np.linspace(-size / 2.0, size / 2.0, res, dtype=np.float32)
-    x, y, z = np.meshgrid(lin, lin, lin, indexing="ij")
-    field = gyroid(x * scale, y * scale, z * scale) - iso
+    scaled = np.multiply(lin, np.float32(scale))
+    s = np.empty_like(scaled)
+    c = np.empty_like(scaled)
+    np.sin(scaled, out=s)
+    np.cos(scaled, out=c)
+    # Fortran order so the ravel(order="F") handed to VTK is a view,
+    # not a full-grid copy per slider update.
+    field = np.empty((res, res, res), dtype=np.float32, order="F")
+    # Assemble in x-slabs small enough to stay in cache, so each block
+    # sees the whole multiply/add/subtract chain before being evicted
+    # instead of streaming the full res^3 array through DRAM per op.
+    sycz = s[:, None] * c[None, :]
+    tile = 16
+    for i0 in range(0, res, tile):
+        i1 = min(res, i0 + tile)
+        blk = field[i0:i1]
+        np.add(s[i0:i1, None, None] * c[None, :, None], sycz[None, :, :], out=blk)
+        blk += s[None, None, :] * c[i0:i1, None, None]
     spacing = (lin[1] - lin[0],) * 3
     origin = (lin[0], lin[0], lin[0])
     return field, spacing, origin
 
 
-def field_to_mesh(field, spacing, origin):
-    grid = pv.ImageData()
-    grid.dimensions = field.shape
-    grid.origin = origin
-    grid.spacing = spacing
-    grid.point_data["values"] = field.ravel(order="F")
-    return grid.contour([0.0])
+_grid_cache = {"grid": None, "contour": None}
+
+
+def field_to_mesh(field, spacing, origin, iso):
+    # Reuse the ImageData between updates when the geometry matches:
+    # overwrite the scalar buffer in place instead of rebuilding the
+    # VTK object and reallocating its arrays on every slider tick.
+    grid = _grid_cache["grid"]
+    rebuilt = (
+        grid is None
+        or tuple(grid.dimensions) != field.shape
+        or tuple(grid.spacing) != tuple(spacing)
+        or tuple(grid.origin) != tuple(origin)
+    )
+    if rebuilt:
+        grid = pv.ImageData()
+        grid.dimensions = field.shape
+        grid.origin = origin
+        grid.spacing = spacing
+        grid.point_data["values"] = field.ravel(order="F")
+        _grid_cache["grid"] = grid
+    else:
+        grid.point_data["values"][:] = field.ravel(order="F")
+        grid.Modified()
+    # Persistent vtkFlyingEdges3D (multithreaded, SIMD-friendly, ~3-5x
+    # faster than the classic contour filter on image data). Keeping the
+    # filter alive lets VTK's pipeline see unchanged inputs: an iso-only
+    # change is just SetValue + Update, with no filter re-instantiation
+    # or pipeline re-wiring per slider tick.
+    contour = _grid_cache["contour"]
+    if contour is None:
+        contour = vtkFlyingEdges3D()
+        contour.ComputeNormalsOn()
+        _grid_cache["contour"] = contour
+    if rebuilt:
+        contour.SetInputData(grid)
+    contour.SetValue(0, iso)
+    contour.Update()
+    return pv.wrap(contour.GetOutput())
 
 
 def export_stl(state: Dict[str, float], out_path: str):
@@ -46,9 +98,8 @@ def export_stl(state: Dict[str, float], out_path: str):
         size=state["size"],
         res=int(state["export_res"]),
         scale=state["scale"],
-        iso=state["iso"],
     )
-    mesh = field_to_mesh(field, spacing, origin)
+    mesh = field_to_mesh(field, spacing, origin, state["iso"])
     mesh.save(out_path)
 
 
@@ -67,20 +118,36 @@ def main():
         "export_res": int(args.export_res),
         "scale": float(args.scale),
         "iso": float(args.iso),
+        "dragging": False,
     }
 
     plotter = pv.Plotter()
     plotter.set_background("#f7f4ef")
     sdf_actor = {"actor": None}
+    field_cache = {"key": None}
 
     def update_mesh(*_args, reset_camera=False):
-        field, spacing, origin = build_field(
-            size=state["size"],
-            res=int(state["preview_res"]),
-            scale=state["scale"],
-            iso=state["iso"],
+        # While a continuous slider is being dragged, preview at half
+        # resolution (~8x less marching-cubes work) and snap back to
+        # full resolution when the interaction ends.
+        res = int(state["preview_res"])
+        if state["dragging"]:
+            res = max(24, res // 2)
+        # The field no longer bakes in iso (the contour filter extracts
+        # at the iso value directly), so it can be cached and iso drags
+        # skip the rebuild entirely.
+        key = (state["size"], res, state["scale"])
+        if key != field_cache.get("key"):
+            field_cache["field"], field_cache["spacing"], field_cache["origin"] = build_field(
+                size=state["size"], res=res, scale=state["scale"]
+            )
+            field_cache["key"] = key
+        mesh = field_to_mesh(
+            field_cache["field"],
+            field_cache["spacing"],
+            field_cache["origin"],
+            state["iso"],
         )
-        mesh = field_to_mesh(field, spacing, origin)
         if sdf_actor["actor"] is None:
             sdf_actor["actor"] = plotter.add_mesh(
                 mesh,
@@ -105,12 +172,19 @@ def main():
 
     def on_scale(value):
         state["scale"] = float(value)
+        state["dragging"] = True
         update_mesh()
 
     def on_iso(value):
         state["iso"] = float(value)
+        state["dragging"] = True
         update_mesh()
 
+    def on_interaction_end(*_args):
+        if state["dragging"]:
+            state["dragging"] = False
+            update_mesh()
+
     def on_export_res(value):
         state["export_res"] = max(30, int(value))
 
@@ -142,7 +216,7 @@ def main():
         pointa=(0.02, 0.18),
         pointb=(0.32, 0.18),
     )
-    plotter.add_slider_widget(
+    scale_widget = plotter.add_slider_widget(
         on_scale,
         [0.05, 0.6],
         value=state["scale"],
@@ -151,7 +225,7 @@ def main():
         pointa=(0.02, 0.24),
         pointb=(0.32, 0.24),
     )
-    plotter.add_slider_widget(
+    iso_widget = plotter.add_slider_widget(
         on_iso,
         [-1.0, 1.0],
         value=state["iso"],
@@ -162,6 +236,11 @@ def main():
     )
 
     plotter.add_key_event("s", on_key_s)
+    # vtkSliderWidget fires EndInteractionEvent on the widget itself, not
+    # on the interactor, so the full-resolution snap-back observer must
+    # hang off the continuous sliders.
+    scale_widget.AddObserver("EndInteractionEvent", on_interaction_end)
+    iso_widget.AddObserver("EndInteractionEvent", on_interaction_end)
 
     update_mesh(reset_camera=True)
     plotter.show()